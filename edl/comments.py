@@ -1,28 +1,37 @@
 import abc, re, typing
+from .statement_types import StatementTypes
 
-class BaseComment(abc.ABC):
-	"""Base class for a given EDL comment"""
+class _LineView(typing.NamedTuple):
+	"""A line along with the pieces of it that comment validators look at"""
 
-	@classmethod
-	def all_statement_types(cls) -> typing.Generator["BaseComment", None, None]:
-		"""Return all subclasses of this type of statement"""
+	line:str
+	stripped:str
+	first_token:str
 
-		for statement in cls.__subclasses__():
-			yield from statement.all_statement_types()
-			yield statement
+	@classmethod
+	def of(cls, line:typing.Union[str, "_LineView"]) -> "_LineView":
+		"""Tokenize a line once, or pass through an existing view"""
+		if isinstance(line, cls):
+			return line
+		stripped = line.strip()
+		return cls(line, stripped, stripped.split(maxsplit=1)[0] if stripped else "")
+
+class BaseComment(StatementTypes, abc.ABC):
+	"""Base class for a given EDL comment"""
 
 	@abc.abstractclassmethod
-	def from_string(cls, line:str) -> "BaseComment":
+	def from_string(cls, line:typing.Union[str, _LineView]) -> "BaseComment":
 		"""Parse a comment from a given string"""
 
 	@classmethod
-	def validate(cls, line:str) -> bool:
+	def validate(cls, line:typing.Union[str, _LineView]) -> bool:
 		"""Validate a string input as a valid comment of this type"""
 
+		view = _LineView.of(line)
 		return all((
-			len(line.strip()),
-			not re.search("[\n]", line),
-			not line.split()[0][0].isnumeric()
+			len(view.stripped),
+			"\n" not in view.line,
+			not view.first_token[:1].isnumeric()
 		))
 
 class FieldComment(BaseComment):
@@ -37,16 +46,14 @@ class FieldComment(BaseComment):
 		self._value = value
 
 	@classmethod
-	def validate(cls, line:str) -> bool:
-		return all((
-			super().validate(line),
-			cls.PAT_MATCH.search(line)
-		))
+	def validate(cls, line:typing.Union[str, _LineView]) -> bool:
+		view = _LineView.of(line)
+		return super().validate(view) and bool(cls.PAT_MATCH.search(view.line))
 	
 	@classmethod
-	def from_string(cls, line:str) -> "FieldComment":
+	def from_string(cls, line:typing.Union[str, _LineView]) -> "FieldComment":
 
-		parsed = line[1:].split(":", maxsplit=1)
+		parsed = _LineView.of(line).line[1:].split(":", maxsplit=1)
 		return cls(
 			field = parsed[0].strip(),
 			value = parsed[1].strip()
@@ -66,17 +73,18 @@ class FieldComment(BaseComment):
 class StandardComment(BaseComment):
 	"""A standard catch-all EDL comment"""
 
-	def __init__(self, comment:str):
-		if not self.validate(comment):
+	def __init__(self, comment:typing.Union[str, _LineView]):
+		view = _LineView.of(comment)
+		if not self.validate(view):
 			raise ValueError("This is not a valid comment")
-		self._comment = comment
+		self._comment = view.line
 
 	@classmethod
-	def from_string(cls, line:str) -> "StandardComment":
+	def from_string(cls, line:typing.Union[str, _LineView]) -> "StandardComment":
 		return cls(comment=line)
 	
 	@classmethod
-	def validate(cls, line:str) -> bool:
+	def validate(cls, line:typing.Union[str, _LineView]) -> bool:
 		"""Is a valid type of StandardComment"""
 
 		return super().validate(line)
@@ -1,5 +1,25 @@
-import typing, io
+import typing, io, itertools, bisect, functools, concurrent.futures
+from timecode import TimecodeRange
 from . import SourceReel, Track, Fcm, Event
+
+class _EventList(list):
+	"""A list of events that counts the changes made to it"""
+
+	version:int = 0
+	"""Incremented on every change to the list"""
+
+def _counts_change(method:typing.Callable) -> typing.Callable:
+	"""Wrap a list method so calling it bumps the list's version"""
+
+	@functools.wraps(method)
+	def wrapper(self:_EventList, *args, **kwargs):
+		self.version += 1
+		return method(self, *args, **kwargs)
+	return wrapper
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+	setattr(_EventList, _name, _counts_change(getattr(list, _name)))
+del _name
 	
 class Edl:
 	"""An Edit Decision List"""
@@ -13,66 +33,93 @@ class Edl:
 
 		self.title = title
 		self.fcm   = fcm
-		self._events = list(events) if events else []
+		self._events = _EventList(events) if events else _EventList()
+		self._record_index = None
 
 	@classmethod
-	def from_file(cls, file_edl:io.BufferedReader):
-		"""Create an EDL from an input file stream"""
+	def from_file(cls, file_edl:io.BufferedReader, workers:typing.Optional[int]=1):
+		"""Create an EDL from an input file stream
 		
-		events = []
-		event_buffer = []
-		current_index = 0
+		Events are parsed across `workers` processes if greater than 1, or one per CPU if `None`
+		"""
+
+		if workers is not None and workers < 1:
+			raise ValueError("Workers must be at least 1, or None for one per CPU")
 
 		title = cls._parse_title_from_line(file_edl.readline())
+		line_num = 2
 		
 		# CMX3600: FCM is not given in the header if PAL
 		last_pos = file_edl.tell()
 		line_fcm = file_edl.readline()
-		if line_fcm.upper().startswith("FCM:"):
+		if line_fcm[:4].upper() == "FCM:":
 			global_fcm = cls._parse_fcm_from_line(line_fcm)
+			line_num += 1
 		else:
 			global_fcm = Fcm.PAL
 			file_edl.seek(last_pos)
+		
+		chunks = cls._chunk_events(file_edl, line_num)
 
-		for line_num, line_edl in enumerate(l.rstrip('\n') for l in file_edl.readlines()):
+		# Events are independent of one another once they're split up
+		if workers is None or workers > 1:
+			with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+				events = list(executor.map(_parse_event_chunk, chunks, chunksize=64))
+		else:
+			events = list(map(_parse_event_chunk, chunks))
+		
+		return cls(title=title, fcm=global_fcm, events=events)
+	
+	@classmethod
+	def _chunk_events(cls, file_edl:io.BufferedReader, first_line_num:int) -> typing.Generator[typing.Tuple[int, typing.List[str]], None, None]:
+		"""Split the remaining lines of an EDL into the lines for each event, along with the line number each starts on"""
 
+		event_buffer = []
+		event_line_num = first_line_num
+		current_index = 0
+
+		# Stream the remaining lines rather than reading the whole file in
+		for line_num, raw in enumerate(file_edl, start=first_line_num):
+
+			line_edl = raw.rstrip('\n')
 			if not line_edl:
 				continue
 
 			try:
-				# If starting next event, process event buffer and flush
-				if event_buffer and cls._is_begin_new_event(line_edl, current_index):
-					events.append(Event.from_string("\n".join(event_buffer)))
-					event_buffer=[]
+				first_token = line_edl.split(maxsplit=1)[0]
+
+				# If starting next event, hand off the event buffer and start a new one
+				# The buffer may still be waiting to be parsed, so it can't be reused
+				if event_buffer and cls._is_begin_new_event(first_token, current_index):
+					yield event_line_num, event_buffer
+					event_buffer = []
 					current_index = 0
 				
 				# Make note of our current event number if specified
-				if line_edl.split()[0].isnumeric():
-					current_index=int(line_edl.split()[0])
+				if first_token.isnumeric():
+					current_index=int(first_token)
 				
+				if not event_buffer:
+					event_line_num = line_num
 				event_buffer.append(line_edl)
 
 			except Exception as e:
-				raise ValueError(f"Line {line_num+2}: {e}")
+				raise ValueError(f"Line {line_num}: {e}")
 		
 		# Take care of the last little feller.
 		# TODO: How to not have to do this?
 		if event_buffer:
-			events.append(Event.from_string("\n".join(event_buffer)))
-		
-		return cls(title=title, fcm=global_fcm, events=events)
+			yield event_line_num, event_buffer
 	
 	@staticmethod
-	def _is_begin_new_event(line:str, current_index:int) -> bool:
-		"""Determine if we're beginning a new event with this line"""
+	def _is_begin_new_event(first_token:str, current_index:int) -> bool:
+		"""Determine if we're beginning a new event with a line starting with this token"""
 
 		if not current_index:
 			return False
-
-		first_token = line.split(maxsplit=1)[0]
 		
 		# Encountered prefixed form statement while parsing an event
-		if first_token.lower() in {"FCM:","SPLIT:"}:
+		if first_token.upper() in {"FCM:","SPLIT:"}:
 			return True
 		
 		# Encountered an event number different than the one we been doin'
@@ -85,7 +132,7 @@ class Edl:
 	def _parse_title_from_line(line:str) -> str:
 		"""Extract a title from a line in an EDL"""
 		START = "title:"
-		if not line.lower().startswith(START):
+		if line[:len(START)].lower() != START:
 			raise ValueError("Title was expected, but not found")
 		title = line[len(START):].strip()
 		if not len(title):
@@ -96,7 +143,7 @@ class Edl:
 	def _parse_fcm_from_line(line:str) -> Fcm:
 		"""Extract the FCM from a line in an EDL"""
 		START = "fcm:"
-		if not line.lower().startswith(START):
+		if line[:len(START)].lower() != START:
 			raise ValueError("FCM was expected, but not found")
 		try:
 			fcm = Fcm(line[len(START):].strip())
@@ -107,9 +154,8 @@ class Edl:
 	def write(self, file:io.TextIOBase):
 		"""Write the EDL to a given stream"""
 
-		print(self.header, file=file)
-		for event in self.events:
-			print(event, file=file)
+		file.write(self.header + "\n")
+		file.writelines(str(event) + "\n" for event in self._events)
 
 	@property
 	def title(self) -> str:
@@ -157,28 +203,59 @@ class Edl:
 	@property
 	def tracks(self) -> list[Track]:
 		"""The tracks used in this EDL"""
-		tracks = set()
-		for e in self.events:
-			tracks = tracks.union(e.tracks)
-		return tracks
+		return set(itertools.chain.from_iterable(e.tracks for e in self._events))
 	
 	@property
 	def events(self) -> list[Event]:
 		"""An EDL event"""
 		return self._events
 	
+	def events_overlapping(self, timecode_range:TimecodeRange) -> list[Event]:
+		"""Events whose record timecodes overlap a given range, in order of record start"""
+
+		_, starts, ends, max_ends, events = self._get_record_index()
+
+		# Only events starting before the range ends, and after the first point an event reaches past the range start
+		hi = bisect.bisect_left(starts, timecode_range.end)
+		lo = bisect.bisect_right(max_ends, timecode_range.start, hi=hi)
+
+		return [events[idx] for idx in range(lo, hi) if ends[idx] > timecode_range.start]
+	
+	def _get_record_index(self) -> typing.Tuple[int, list, list, list, list]:
+		"""Record extents of all events, as parallel lists sorted by record start"""
+
+		# Rebuild whenever the event list has been modified since
+		if self._record_index is None or self._record_index[0] != self._events.version:
+			
+			extents = sorted(((e.timecode_extents, e) for e in self._events), key=lambda x: x[0].start)
+			starts = [tc_range.start for tc_range, _ in extents]
+			ends = [tc_range.end for tc_range, _ in extents]
+			max_ends = list(itertools.accumulate(ends, max))
+			events = [e for _, e in extents]
+			
+			self._record_index = (self._events.version, starts, ends, max_ends, events)
+		
+		return self._record_index
+	
 	@property
 	def sources(self) -> set[SourceReel]:
 		"""A set of all sources in the EDL"""
-		sources = set()
-		for e in self.events:
-			sources = sources.union(e.sources)
-		return sources
+		# Straight from the statements, skipping the per-event sets
+		return set(s.source for s in itertools.chain.from_iterable(e.standard_statements for e in self._events))
 	
 	def __str__(self):
-		file_text = io.StringIO()
-		self.write(file_text)
-		return file_text.getvalue()
+		# Same output as write(), without the round-trip through a stream
+		return self.header + "\n" + "".join(str(event) + "\n" for event in self._events)
 	
 	def __repr__(self):
-		return f"<{self.__class__.__name__} title={self.title} FCM={self.fcm} events={len(self.events)}>"
\ No newline at end of file
+		return f"<{self.__class__.__name__} title={self.title} FCM={self.fcm} events={len(self.events)}>"
+
+def _parse_event_chunk(chunk:typing.Tuple[int, typing.List[str]]) -> Event:
+	"""Parse an event from a chunk given by `Edl._chunk_events()`"""
+	# Module-level so it can be sent off to worker processes
+
+	line_num, lines = chunk
+	try:
+		return Event.from_lines(lines)
+	except Exception as e:
+		raise ValueError(f"Line {line_num}: {e}")
\ No newline at end of file
@@ -1,39 +1,133 @@
-import typing
+import typing, re
 from timecode import Timecode, TimecodeRange
 from . import StandardFormStatement, NoteFormStatement, SourceReel, Track, Fcm, BaseComment
+from .comments import _LineView
+
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"), (re.ASCII, "a"))
+
+def _scoped_pattern(pattern:re.Pattern) -> str:
+	"""A pattern as a non-capturing group carrying its own compile flags"""
+
+	flags = "".join(letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag)
+	# Inner named groups can't repeat across alternatives, so they're made non-capturing here.
+	return f"(?{flags}:" + re.sub(r"\(\?P<\w+>", "(?:", pattern.pattern.lstrip("^")) + ")"
+
+def _combine_patterns(statement_types:typing.Iterable[type], attr:str) -> typing.Tuple[re.Pattern, typing.Dict[str, type]]:
+	"""Alternate the patterns of several statement types into a single dispatch pattern"""
+
+	# The outer group name identifies the statement type; its own pattern then parses the groups.
+	# Each type keeps its own flags, so nothing is applied to the pattern as a whole.
+	by_name = {f"_{idx}": s for idx, s in enumerate(t for t in statement_types if isinstance(getattr(t, attr, None), re.Pattern))}
+	combined = "|".join(
+		f"(?P<{name}>{_scoped_pattern(getattr(s, attr))})"
+		for name, s in by_name.items()
+	)
+	return re.compile(combined or "(?!)"), by_name
+
+_COMBINED_CACHE:typing.Dict[type, typing.Tuple[tuple, re.Pattern, typing.Dict[str, type]]] = {}
+
+def _combined_pattern(base:type, attr:str) -> typing.Tuple[re.Pattern, typing.Dict[str, type]]:
+	"""The dispatch pattern for all statement types currently defined under a base statement"""
+
+	# all_statement_types() hands back the same tuple until a new subclass is defined
+	statement_types = base.all_statement_types()
+	cached = _COMBINED_CACHE.get(base)
+	if cached is None or cached[0] is not statement_types:
+		cached = _COMBINED_CACHE[base] = (statement_types, *_combine_patterns(statement_types, attr))
+	return cached[1], cached[2]
+
+def _identify_sfm(line:str) -> typing.Optional[StandardFormStatement]:
+	"""Parse a line as a standard form statement, if it is one"""
+
+	pattern, by_name = _combined_pattern(StandardFormStatement, "PAT_EVENT")
+	match = pattern.match(line)
+	if match:
+		s = by_name[match.lastgroup]
+		statement = s.PAT_EVENT.match(line)
+		if statement:
+			return s.parse_from_pattern(statement)
+
+	# Get all weird about it if we didn't recognize a line with an event number at the beginning as an SFM
+	if line[:1].isnumeric():
+		raise ValueError(f"Unrecognized standard form statement")
+	
+	return None
+
+def _identify_nfm(line:str) -> typing.Optional[NoteFormStatement]:
+	"""Parse a line as a note form statement, if it is one"""
+
+	pattern, by_name = _combined_pattern(NoteFormStatement, "PAT_NOTE")
+	match = pattern.match(line)
+	if match:
+		n = by_name[match.lastgroup]
+		statement = n.PAT_NOTE.match(line)
+		if statement:
+			return n.parse_from_pattern(statement)
+	
+	return None
+
+def _identify_comment(line:str) -> typing.Optional[BaseComment]:
+	"""Parse a line as a comment, if it is one"""
+
+	# Tokenize once and share that across all the comment validators
+	view = _LineView.of(line)
+	for c in BaseComment.all_statement_types():
+		if c.validate(view):
+			return c.from_string(view)
+	
+	return None
+
+_ALL_FAMILIES = (_identify_sfm, _identify_nfm, _identify_comment)
+_FIRST_CHAR_DISPATCH = {
+	**{c: (_identify_sfm,) for c in "0123456789"},
+	"M": (_identify_nfm, _identify_comment),
+	"*": (_identify_comment,),
+}
 
 class Event:
 	"""An EDL Event"""
 
-	def __init__(self, standard_statements:typing.Iterable[StandardFormStatement], note_statements:typing.Optional[typing.Iterable["NoteFormStatement"]]=None, comments=typing.Optional[typing.Iterable[BaseComment]]):
+	def __init__(self, standard_statements:typing.Iterable[StandardFormStatement], note_statements:typing.Optional[typing.Iterable["NoteFormStatement"]]=None, comments:typing.Optional[typing.Iterable[BaseComment]]=None, leading_notes:typing.Optional[typing.Iterable[typing.Union[NoteFormStatement, BaseComment]]]=None):
 
-		self._sfs = list(standard_statements)
+		self._sfs = tuple(standard_statements)
 		if not len(self._sfs):
 			raise ValueError(f"An event must contain at least one standard form statement (zero were given)")
-		self._nfs = note_statements if note_statements else []
+		self._nfs = tuple(note_statements) if note_statements else tuple()
 		
 		fcm = {s.fcm for s in self._sfs}
 		if len(fcm) != 1:
 			raise ValueError(f"Standard Form Statements must have matching FCMs")
 		self._fcm = fcm.pop()
 
-		self._comments = comments if comments else list() # TODO: Temp thing
+		self._comments = tuple(comments) if comments else tuple() # TODO: Temp thing
+
+		# Lines like FCM: or SPLIT: that come before the event's first statement
+		self._leading = tuple(leading_notes) if leading_notes else tuple()
 
 	@classmethod
 	def from_string(cls, event:str) -> "Event":
 		"""Parse an event from an event string"""
 
+		return cls.from_lines(event.splitlines(keepends=False))
+
+	@classmethod
+	def from_lines(cls, lines:typing.Iterable[str]) -> "Event":
+		"""Parse an event from the individual lines of an event"""
+
 		sfs = list()
 		nfs = list()
 		comments = list()
+		leading = list()
 
-		for line in event.splitlines(keepends=False):
+		for line in lines:
 			if not line.strip():
 				continue
 
 			parsed = cls._identify_line(line)
 			if isinstance(parsed, StandardFormStatement):
 				sfs.append(parsed)
+			elif not sfs and isinstance(parsed, (NoteFormStatement, BaseComment)):
+				leading.append(parsed)
 			elif isinstance(parsed, NoteFormStatement):
 				nfs.append(parsed)
 			elif isinstance(parsed, BaseComment):
@@ -44,57 +138,44 @@ class Event:
 		return cls(
 			standard_statements = sfs,
 			note_statements = nfs,
-			comments = comments
+			comments = comments,
+			leading_notes = leading
 		)
 			
 	@classmethod
 	def _identify_line(cls, line:str) -> typing.Union[StandardFormStatement, NoteFormStatement, str]:
 		"""Identify a line"""
-		#print(line)
-		for s in StandardFormStatement.all_statement_types():
-		#	print(s)
-			match = s.PAT_EVENT.match(line)
-			if match:
-				parsed = s.parse_from_pattern(match)
-				return parsed
-
-		# Get all weird about it if we didn't recognize a line with an event number at the beginning as an SFM
-		if line and line[0].isnumeric():
-			raise ValueError(f"Unrecognized standard form statement")
 
-		for n in NoteFormStatement.all_statement_types():
-			match = n.PAT_NOTE.match(line)
-			if match:
-				parsed = n.parse_from_pattern(match)
+		# The first character narrows down which family of statement this could be
+		for identify in _FIRST_CHAR_DISPATCH.get(line[:1].upper(), _ALL_FAMILIES):
+			parsed = identify(line)
+			if parsed is not None:
 				return parsed
 		
-		for c in BaseComment.all_statement_types():
-			if c.validate(line):
-				return c.from_string(line)
-		
 		raise ValueError(f"Unrecognized line")
 
 		
 	@property
 	def tracks(self) -> typing.Set["Track"]:
 		"""The track(s) this event belongs to"""
-		tracks = set()
-		for s in self._sfs:
-			for track in s.tracks:
-				tracks.add(track)
-		return tracks
+		return {track for s in self._sfs for track in s.tracks}
 	
 	@property
-	def standard_statements(self) -> typing.Generator["StandardFormStatement", None, None]:
-		yield from self._sfs
+	def standard_statements(self) -> typing.Tuple["StandardFormStatement", ...]:
+		return self._sfs
 
 	@property
-	def note_statements(self) -> typing.Generator["NoteFormStatement", None, None]:
-		yield from self._nfs
+	def note_statements(self) -> typing.Tuple["NoteFormStatement", ...]:
+		return self._nfs
+	
+	@property
+	def leading_notes(self) -> typing.Tuple[typing.Union[NoteFormStatement, BaseComment], ...]:
+		"""Notes and comments given before the first standard form statement of this event"""
+		return self._leading
 	
 	@property
-	def comments(self) -> typing.Generator[BaseComment, None, None]:
-		yield from self._comments
+	def comments(self) -> typing.Tuple[BaseComment, ...]:
+		return self._comments
 	
 	@property
 	def sources(self) -> typing.Set[SourceReel]:
@@ -129,7 +210,8 @@ class Event:
 	def __str__(self) -> str:
 		# TODO: Add the rest
 
-		return "\n".join([
+		# Leading notes go back where they came from, before the statements
+		return "\n".join([str(l) for l in self._leading] + [
 			"\n".join(str(s) for s in self._sfs),
 			"\n".join(str(n) for n in self._nfs),
 			"\n".join(str(c) for c in self.comments)
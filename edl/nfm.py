@@ -1,8 +1,10 @@
-import abc, typing, re
+import abc, re
 from timecode import Timecode
 from . import SourceReel
+from .sfm import _PAT_TIMECODE, _parse_timecode
+from .statement_types import StatementTypes
 
-class NoteFormStatement(abc.ABC):
+class NoteFormStatement(StatementTypes, abc.ABC):
 	"""Note form statement"""
 
 	""""
@@ -20,14 +22,6 @@ class NoteFormStatement(abc.ABC):
 		SPLIT:    VIDEO DELAY=  00:00:02:00
 	"""
 
-	@classmethod
-	def all_statement_types(cls) -> typing.Generator["NoteFormStatement", None, None]:
-		"""Return all subclasses of this type of statement"""
-
-		for statement in cls.__subclasses__():
-			yield from statement.all_statement_types()
-			yield statement
-
 class MotionMemoryNoteFormStatement(NoteFormStatement):
 	"""A motion memory (M2) note form statement"""
 	# TODO: Currently supports respeeds but no variable (%) data
@@ -38,8 +32,8 @@ class MotionMemoryNoteFormStatement(NoteFormStatement):
 		r"(?P<reel_name>[^\s]+)"
 		r"\s+"
 		r"(?P<speed>[\+\-\.0-9]+)\s+"
-		r"(?P<tc_src_start>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-	, re.I)
+		rf"(?P<tc_src_start>{_PAT_TIMECODE})\s+"
+	, re.IGNORECASE | re.ASCII)
 
 	def __init__(self, reel_name:str, speed:float, tc_start:Timecode):
 		self._reel = SourceReel.from_string(reel_name)
@@ -71,8 +65,8 @@ class MotionMemoryNoteFormStatement(NoteFormStatement):
 		"""Create an M2 note from a parsed regex string"""
 
 		reel_name = statement.group("reel_name")
-		speed = float(statement.group("speed"))
-		tc_start = Timecode(statement.group("tc_src_start"))
+		speed = statement.group("speed")
+		tc_start = _parse_timecode(statement.group("tc_src_start"))
 
 		return cls(
 			reel_name=reel_name,
@@ -1,8 +1,18 @@
-import abc, typing, re
+import abc, typing, re, functools
 from timecode import Timecode, TimecodeRange
 from . import SourceReel, Track, Fcm
+from .statement_types import StatementTypes
 
-class StandardFormStatement(abc.ABC):
+_PAT_TIMECODE = r"[0-9]{2}:[0-9]{2}:[0-9]{2}:[0-9]{2}"
+"""Regex fragment matching a single HH:MM:SS:FF timecode"""
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timecode(timecode:str) -> Timecode:
+	"""Parse a timecode string, reusing the result for timecodes seen recently"""
+	# Record outs generally reappear as the next event's record in
+	return Timecode(timecode)
+
+class StandardFormStatement(StatementTypes, abc.ABC):
 	"""A base standard form statement"""
 
 	"""
@@ -22,24 +32,22 @@ class StandardFormStatement(abc.ABC):
 	def __init__(self, reel_name:str, tracks:typing.Iterable["Track"], timecode_source:TimecodeRange, timecode_record:TimecodeRange, event_number:typing.Optional[int]=None):
 		"""Basic parsing of common elements"""
 		self._reel = SourceReel.from_string(reel_name)
-		self._tracks = tracks
+		# Frozen, so the track string below can't fall out of step with it
+		self._tracks = frozenset(tracks)
+		self._tracks_str = "".join([t.name for t in self._tracks])
 		self._timecode_source = timecode_source
 		self._timecode_record = timecode_record
 		self._event_number = int(event_number) if event_number is not None else None
 
-	@classmethod
-	def all_statement_types(cls) -> typing.Generator["StandardFormStatement", None, None]:
-		"""Return all subclasses of this type of statement"""
-
-		for statement in cls.__subclasses__():
-			yield from statement.all_statement_types()
-			yield statement
 	
 	@property
 	def PAT_EVENT(self) -> re.Pattern:
 		"""Regex pattern matching this statement type"""
 		pass
 
+	_FORMAT:str = ""
+	"""Layout of this statement as a line in an EDL, filled in from `_format_fields()`"""
+
 	@abc.abstractclassmethod
 	def parse_from_pattern(self, statement:re.Pattern) -> "StandardFormStatement":
 		"""Create a statement object from a parsed regex object"""
@@ -54,20 +62,38 @@ class StandardFormStatement(abc.ABC):
 		return cls.parse_from_pattern(pat)
 	
 	@classmethod
-	def _parse_shared_elements(cls, statement:re.Pattern) -> typing.Tuple[int, str, typing.Set["Track"], TimecodeRange, TimecodeRange]:
+	def _parse_shared_elements(cls, statement:re.Pattern) -> typing.Tuple[str, str, typing.Set["Track"], TimecodeRange, TimecodeRange]:
 
-		event_number = int(statement.group("event_number"))
-		reel_name = statement.group("reel_name")
-		tracks = {Track(statement.group("track_type"))}
+		# Pull every shared field out of the match in one go
+		# Numeric fields stay as matched; the constructors coerce them anyway
+		event_number, reel_name, track_type, tc_src_in, tc_src_out, tc_rec_in, tc_rec_out = statement.group(
+			"event_number", "reel_name", "track_type", "tc_src_in", "tc_src_out", "tc_rec_in", "tc_rec_out"
+		)
+		tracks = {Track(track_type)}
 		timecode_source = TimecodeRange(
-			start=Timecode(statement.group("tc_src_in")), end=Timecode(statement.group("tc_src_out"))
+			start=_parse_timecode(tc_src_in), end=_parse_timecode(tc_src_out)
 		)
 		timecode_record = TimecodeRange(
-			start=Timecode(statement.group("tc_rec_in")), end=Timecode(statement.group("tc_rec_out"))
+			start=_parse_timecode(tc_rec_in), end=_parse_timecode(tc_rec_out)
 		)
 
 		return event_number, reel_name, tracks, timecode_source, timecode_record
 	
+	def _format_fields(self) -> typing.Dict[str, typing.Any]:
+		"""Field values for filling in this statement's `_FORMAT` layout"""
+		return {
+			"event_number": self._event_number if self._event_number is not None else 1,
+			"reel_name":    self.reel_name,
+			"tracks":       self._tracks_str,
+			"tc_src_in":    self._timecode_source.start,
+			"tc_src_out":   self._timecode_source.end,
+			"tc_rec_in":    self._timecode_record.start,
+			"tc_rec_out":   self._timecode_record.end,
+		}
+	
+	def __str__(self):
+		return self._FORMAT.format_map(self._format_fields())
+	
 	@property
 	def source(self) -> SourceReel:
 		"""The source reel referenced for this statement"""
@@ -79,7 +105,7 @@ class StandardFormStatement(abc.ABC):
 		return str(self.source.name)
 	
 	@property
-	def tracks(self) -> typing.Set["Track"]:
+	def tracks(self) -> typing.FrozenSet["Track"]:
 		"""The tracks referenced in this statement"""
 		return self._tracks
 	
@@ -118,15 +144,15 @@ class CutStatement(StandardFormStatement):
 		)
 
 	PAT_EVENT = re.compile(
-		r"^(?P<event_number>\d+)\s+"
+		r"^(?P<event_number>[0-9]+)\s+"
 		r"(?P<reel_name>[^\s]+)\s+"
-		r"(?P<track_type>A\d*|B|V)\s+"
+		r"(?P<track_type>A[0-9]*|B|V)\s+"
 		r"(?P<event_type>C)\s+"
-		r"(?P<tc_src_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_src_out>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_out>\d{2}:\d{2}:\d{2}:\d{2})\s*$"
-	, re.I)
+		rf"(?P<tc_src_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_src_out>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_out>{_PAT_TIMECODE})\s*$"
+	, re.IGNORECASE | re.ASCII)
 
 	@classmethod
 	def parse_from_pattern(cls, statement:re.Pattern) -> "CutStatement":
@@ -142,24 +168,23 @@ class CutStatement(StandardFormStatement):
 			event_number = event_number
 		)
 	
-	def __str__(self):
-		# TODO: Additional formatting options (spacing, number padding)
-		return f"{str(self.event_number if self.event_number is not None else 1).zfill(3)}  {self.reel_name.ljust(128)}  {str().join(t.name for t in self.tracks).ljust(3)}  C       {self.timecode_source.start} {self.timecode_source.end} {self.timecode_record.start} {self.timecode_record.end}"
+	# TODO: Additional formatting options (spacing, number padding)
+	_FORMAT = "{event_number:0>3}  {reel_name:<128}  {tracks:<3}  C       {tc_src_in} {tc_src_out} {tc_rec_in} {tc_rec_out}"
 
 class DissolveStatement(StandardFormStatement):
 	"""A dissolve statement"""
 
 	PAT_EVENT = re.compile(
-		r"^(?P<event_number>\d+)\s+"
+		r"^(?P<event_number>[0-9]+)\s+"
 		r"(?P<reel_name>[^\s]+)\s+"
-		r"(?P<track_type>A\d*|B|V)\s+"
+		r"(?P<track_type>A[0-9]*|B|V)\s+"
 		r"(?P<event_type>D)\s+"
-		r"(?P<event_duration>\d+)\s+"
-		r"(?P<tc_src_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_src_out>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_out>\d{2}:\d{2}:\d{2}:\d{2})\s*$"
-	, re.I)
+		r"(?P<event_duration>[0-9]+)\s+"
+		rf"(?P<tc_src_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_src_out>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_out>{_PAT_TIMECODE})\s*$"
+	, re.IGNORECASE | re.ASCII)
 
 	def __init__(self, reel_name:str, tracks:typing.Iterable["Track"], timecode_source:TimecodeRange, timecode_record:TimecodeRange, dissolve_length:int, event_number:typing.Optional[int]=None):
 
@@ -187,30 +212,32 @@ class DissolveStatement(StandardFormStatement):
 		return cls(
 			reel_name = reel_name,
 			tracks = tracks,
-			dissolve_length = int(statement.group("event_duration")),
+			dissolve_length = statement.group("event_duration"),
 			timecode_source = timecode_source,
 			timecode_record = timecode_record,
 			event_number = event_number
 		)
 
-	def __str__(self):
-		# TODO: Additional formatting options
-		return f"{str(self.event_number if self.event_number is not None else 1).zfill(3)}  {self.reel_name.ljust(128)}  {str().join(t.name for t in self.tracks).ljust(3)}  D  {str(self.dissolve_length).zfill(3)}  {self.timecode_source.start} {self.timecode_source.end} {self.timecode_record.start} {self.timecode_record.end}"
+	# TODO: Additional formatting options
+	_FORMAT = "{event_number:0>3}  {reel_name:<128}  {tracks:<3}  D  {dissolve_length:0>3}  {tc_src_in} {tc_src_out} {tc_rec_in} {tc_rec_out}"
+
+	def _format_fields(self) -> typing.Dict[str, typing.Any]:
+		return {**super()._format_fields(), "dissolve_length": self.dissolve_length}
 
 class WipeStatement(StandardFormStatement):
 	"""A wipe statement"""
 
 	PAT_EVENT = re.compile(
-		r"^(?P<event_number>\d+)\s+"
+		r"^(?P<event_number>[0-9]+)\s+"
 		r"(?P<reel_name>[^\s]+)\s+"
-		r"(?P<track_type>A\d*|B|V)\s+"
-		r"(?P<event_type>W\d+)\s+"
-		r"(?P<event_duration>\d+)\s+"
-		r"(?P<tc_src_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_src_out>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_out>\d{2}:\d{2}:\d{2}:\d{2})\s*$"
-	, re.I)
+		r"(?P<track_type>A[0-9]*|B|V)\s+"
+		r"(?P<event_type>W[0-9]+)\s+"
+		r"(?P<event_duration>[0-9]+)\s+"
+		rf"(?P<tc_src_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_src_out>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_out>{_PAT_TIMECODE})\s*$"
+	, re.IGNORECASE | re.ASCII)
 
 	def __init__(self, reel_name:str, tracks:typing.Iterable["Track"], timecode_source:TimecodeRange, timecode_record:TimecodeRange, wipe_length:int, wipe_id:int, event_number:typing.Optional[int]=None):
 
@@ -234,8 +261,8 @@ class WipeStatement(StandardFormStatement):
 		return cls(
 			reel_name = reel_name,
 			tracks = tracks,
-			wipe_length = int(statement.group("event_duration")),
-			wipe_id     = int(statement.group("event_type")[1:]),
+			wipe_length = statement.group("event_duration"),
+			wipe_id     = statement.group("event_type")[1:],
 			timecode_source = timecode_source,
 			timecode_record = timecode_record,
 			event_number = event_number
@@ -251,24 +278,26 @@ class WipeStatement(StandardFormStatement):
 		"""CMX Wipe ID"""
 		return self._wipe_id
 	
-	def __str__(self):
-		# TODO: Additional formatting options
-		return f"{str(self.event_number if self.event_number is not None else 1).zfill(3)}  {self.reel_name.ljust(128)}  {str().join(t.name for t in self.tracks).ljust(3)}  W{str(self.wipe_id).zfill(3)}  {str(self.wipe_length).zfill(3)}  {self.timecode_source.start} {self.timecode_source.end} {self.timecode_record.start} {self.timecode_record.end}"
+	# TODO: Additional formatting options
+	_FORMAT = "{event_number:0>3}  {reel_name:<128}  {tracks:<3}  W{wipe_id:0>3}  {wipe_length:0>3}  {tc_src_in} {tc_src_out} {tc_rec_in} {tc_rec_out}"
+
+	def _format_fields(self) -> typing.Dict[str, typing.Any]:
+		return {**super()._format_fields(), "wipe_id": self.wipe_id, "wipe_length": self.wipe_length}
 
 class KeyForegroundStatement(StandardFormStatement):
 	"""The edit includes a key"""
 
 	PAT_EVENT = re.compile(
-		r"^(?P<event_number>\d+)\s+"
+		r"^(?P<event_number>[0-9]+)\s+"
 		r"(?P<reel_name>[^\s]+)\s+"
-		r"(?P<track_type>A\d*|B|V)\s+"
+		r"(?P<track_type>A[0-9]*|B|V)\s+"
 		r"(?P<event_type>K)\s+"
-		r"(?P<event_duration>\d+)\s+"
-		r"(?P<tc_src_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_src_out>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_out>\d{2}:\d{2}:\d{2}:\d{2})\s*$"
-	, re.I)
+		r"(?P<event_duration>[0-9]+)\s+"
+		rf"(?P<tc_src_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_src_out>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_out>{_PAT_TIMECODE})\s*$"
+	, re.IGNORECASE | re.ASCII)
 
 	def __init__(self, reel_name:str, tracks:typing.Iterable["Track"], timecode_source:TimecodeRange, timecode_record:TimecodeRange, dissolve_length:int, event_number:typing.Optional[int]=None):
 
@@ -296,31 +325,33 @@ class KeyForegroundStatement(StandardFormStatement):
 		return cls(
 			reel_name = reel_name,
 			tracks = tracks,
-			dissolve_length = int(statement.group("event_duration")),
+			dissolve_length = statement.group("event_duration"),
 			timecode_source = timecode_source,
 			timecode_record = timecode_record,
 			event_number = event_number
 		)
 
-	def __str__(self):
-		# TODO: Additional formatting options
-		return f"{str(self.event_number if self.event_number is not None else 1).zfill(3)}  {self.reel_name.ljust(128)}  {str().join(t.name for t in self.tracks).ljust(3)}  K  {str(self.dissolve_length).zfill(3)}  {self.timecode_source.start} {self.timecode_source.end} {self.timecode_record.start} {self.timecode_record.end}"
+	# TODO: Additional formatting options
+	_FORMAT = "{event_number:0>3}  {reel_name:<128}  {tracks:<3}  K  {dissolve_length:0>3}  {tc_src_in} {tc_src_out} {tc_rec_in} {tc_rec_out}"
+
+	def _format_fields(self) -> typing.Dict[str, typing.Any]:
+		return {**super()._format_fields(), "dissolve_length": self.dissolve_length}
 	
 
 class KeyBackgroundStatement(StandardFormStatement):
 	"""The edit includes a key"""
 
 	PAT_EVENT = re.compile(
-		r"^(?P<event_number>\d+)\s+"
+		r"^(?P<event_number>[0-9]+)\s+"
 		r"(?P<reel_name>[^\s]+)\s+"
-		r"(?P<track_type>A\d*|B|V)\s+"
+		r"(?P<track_type>A[0-9]*|B|V)\s+"
 		r"(?P<event_type>K\s?B)\s+"
 		r"(?P<fade_condition>\(F\))?\s+"
-		r"(?P<tc_src_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_src_out>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_in>\d{2}:\d{2}:\d{2}:\d{2})\s+"
-		r"(?P<tc_rec_out>\d{2}:\d{2}:\d{2}:\d{2})\s*$"
-	, re.I)
+		rf"(?P<tc_src_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_src_out>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_in>{_PAT_TIMECODE})\s+"
+		rf"(?P<tc_rec_out>{_PAT_TIMECODE})\s*$"
+	, re.IGNORECASE | re.ASCII)
 
 	def __init__(self, reel_name:str, tracks:typing.Iterable["Track"], timecode_source:TimecodeRange, timecode_record:TimecodeRange, fade_condition:bool, event_number:typing.Optional[int]=None):
 
@@ -348,12 +379,14 @@ class KeyBackgroundStatement(StandardFormStatement):
 		return cls(
 			reel_name = reel_name,
 			tracks = tracks,
-			fade_condition = bool(statement.group("fade_condition")),
+			fade_condition = statement.group("fade_condition"),
 			timecode_source = timecode_source,
 			timecode_record = timecode_record,
 			event_number = event_number
 		)
 
-	def __str__(self):
-		# TODO: Additional formatting options
-		return f"{str(self.event_number if self.event_number is not None else 1).zfill(3)}  {self.reel_name.ljust(128)}  {str().join(t.name for t in self.tracks).ljust(3)}  K B  {'(F)' if self.has_fade_condition else '   '}  {self.timecode_source.start} {self.timecode_source.end} {self.timecode_record.start} {self.timecode_record.end}"
\ No newline at end of file
+	# TODO: Additional formatting options
+	_FORMAT = "{event_number:0>3}  {reel_name:<128}  {tracks:<3}  K B  {fade_condition}  {tc_src_in} {tc_src_out} {tc_rec_in} {tc_rec_out}"
+
+	def _format_fields(self) -> typing.Dict[str, typing.Any]:
+		return {**super()._format_fields(), "fade_condition": "(F)" if self.has_fade_condition else "   "}
\ No newline at end of file
@@ -1,4 +1,4 @@
-import abc, re
+import abc, functools, sys
 
 class SourceReel(abc.ABC):
 	"""A base source for use as a reel name in a Standard Form Statement"""
@@ -16,6 +16,8 @@ class SourceReel(abc.ABC):
 		return self.name
 	
 	def __eq__(self, other):
+		if self is other:
+			return True
 		return self.name == other.name
 	
 	def __hash__(self):
@@ -24,20 +26,27 @@ class SourceReel(abc.ABC):
 	@classmethod
 	def from_string(cls, reel_name:str):
 
-		if BlackSource.validate(reel_name):
+		reel_upper = reel_name.upper()
+		if reel_upper == BlackSource._NAME:
 			return BlackSource()
-		elif AuxSource.validate(reel_name):
+		elif reel_upper == AuxSource._NAME:
 			return AuxSource()
-		elif TapeSource.validate(reel_name):
-			return TapeSource(reel_name)
 		else:
-			raise ValueError("Reel name format is not recognized")
+			return _make_tape(reel_name)
 
 class BlackSource(SourceReel):
 	"""A black/empty source"""
 
 	_NAME = "BL"
 
+	_INSTANCE = None
+
+	def __new__(cls):
+		# Black is black; share the one instance
+		if cls._INSTANCE is None:
+			cls._INSTANCE = super().__new__(cls)
+		return cls._INSTANCE
+
 	@classmethod
 	def validate(self, reel_name:str) -> bool:
 		"""Is this a valid Black source"""
@@ -48,6 +57,14 @@ class AuxSource(SourceReel):
 
 	_NAME = "AX"
 
+	_INSTANCE = None
+
+	def __new__(cls):
+		# Aux sources carry no identity of their own; share the one instance
+		if cls._INSTANCE is None:
+			cls._INSTANCE = super().__new__(cls)
+		return cls._INSTANCE
+
 	@classmethod
 	def validate(self, reel_name:str) -> bool:
 		return reel_name.upper() == "AX"
@@ -69,9 +86,27 @@ class TapeSource(SourceReel):
 			raise ValueError(f"Reel name contains invalid characters for this source type")
 
 		super().__init__()
-		self._NAME = reel_name
+		# Reel names repeat a lot; intern them so equal names are usually the same object
+		self._NAME = sys.intern(reel_name)
+		self._hash = hash(self._NAME)
+
+	def __hash__(self):
+		return self._hash
+
+	def __reduce__(self):
+		# String hashes differ between processes, so rebuild from the name rather than carry `_hash` along
+		return (_make_tape, (self._NAME,))
 
 	@classmethod
 	def validate(cls, reel_name:str) -> bool:
 		# TODO: CMX3600: Special characters except comma (,) and space ( ) can occur within reel names
-		return len(reel_name.strip()) and not re.search("[\s]", reel_name)
\ No newline at end of file
+		# Splitting on whitespace leaves the name untouched only if it contains none
+		return bool(reel_name) and reel_name.split(maxsplit=1) == [reel_name]
+
+@functools.lru_cache(maxsize=4096)
+def _make_tape(reel_name:str) -> TapeSource:
+	"""Create a tape source, reusing the instance for reel names seen recently"""
+
+	if not TapeSource.validate(reel_name):
+		raise ValueError("Reel name format is not recognized")
+	return TapeSource(reel_name)
\ No newline at end of file
@@ -0,0 +1,28 @@
+import typing
+
+class StatementTypes:
+	"""Mixin for base statements to look up all of their statement types"""
+
+	_ALL_TYPES_CACHE:typing.Optional[typing.Tuple[type, ...]] = None
+	"""Memoized result of `all_statement_types()` for a given class"""
+
+	def __init_subclass__(cls, **kwargs):
+		"""Invalidate the cached statement types of all ancestors"""
+		super().__init_subclass__(**kwargs)
+		for ancestor in cls.__mro__[1:]:
+			if "_ALL_TYPES_CACHE" in vars(ancestor):
+				ancestor._ALL_TYPES_CACHE = None
+
+	@classmethod
+	def all_statement_types(cls) -> typing.Tuple[type, ...]:
+		"""Return all subclasses of this type of statement"""
+
+		# Look up the cache on this class only; an inherited one would belong to an ancestor
+		cached = vars(cls).get("_ALL_TYPES_CACHE")
+		if cached is None:
+			statements = []
+			for statement in cls.__subclasses__():
+				statements.extend(statement.all_statement_types())
+				statements.append(statement)
+			cached = cls._ALL_TYPES_CACHE = tuple(statements)
+		return cached
\ No newline at end of file
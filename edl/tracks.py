@@ -4,7 +4,8 @@ import enum, functools
 class Track:
 	"""A track containing events in the EDL"""
 
-	tracks = set()
+	_INSTANCES:dict[tuple, "Track"] = {}
+	"""Tracks created so far, by class and type/index, and by class and the name they were asked for with"""
 
 	class Type(enum.Enum):
 		"""Types of EDL tracks"""
@@ -15,19 +16,43 @@ class Track:
 		AUDIO = "A"
 		"""Audio track"""
 
+	def __new__(cls, name:str):
+		# Tracks are immutable, so every Track("V") can be the same Track
+		track = cls._INSTANCES.get((cls, name))
+		if track is not None:
+			return track
+
+		track_type = cls.Type(name[0].upper())
+		track_index = int(name[1:]) if len(name) > 1 else 1
+
+		# Other spellings of the same track ("v", "V1") share its instance too
+		track = cls._INSTANCES.get((cls, track_type, track_index))
+		if track is None:
+			track = super().__new__(cls)
+			track._type = track_type
+			track._index = track_index
+
+			# Tracks don't change after creation; so neither does the name
+			track._name = track_type.value + str(track_index) if track_index > 1 else track_type.value
+			track._hash = hash(track._name)
+
+			cls._INSTANCES[(cls, track_type, track_index)] = track
+		
+		cls._INSTANCES[(cls, name)] = track
+		return track
+
 	def __init__(self, name:str):
 		"""Create a new EDL track"""
-
-		self._type = self.__class__.Type(name[0].upper())
-		self._index = int(name[1:]) if len(name) > 1 else 1
+		# All set up in __new__, since a Track may come back already made
+	
+	def __reduce__(self):
+		# Unpickle by name alone; the registry hands back the one instance, and no hash from another process comes along
+		return (self.__class__, (self._name,))
 	
 	@property
 	def name(self) -> str:
 		"""The name of the track"""
-		if self._index > 1:
-			return self._type.value + str(self._index)
-		else:
-			return self._type.value
+		return self._name
 	
 	@property
 	def type(self) -> Type:
@@ -40,6 +65,8 @@ class Track:
 		return self._index
 	
 	def __eq__(self, other) -> bool:
+		if self is other:
+			return True
 		if not isinstance(other, self.__class__):
 			return False
 		return self.name == other.name
@@ -50,7 +77,7 @@ class Track:
 		return self.track_index < other.track_index
 	
 	def __hash__(self) -> int:
-		return hash(self.name)
+		return self._hash
 	
 	def __str__(self) -> str:
 		return self.name